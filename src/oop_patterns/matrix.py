@@ -1,18 +1,49 @@
 """Class representing a matrix with basic operations."""
 
-from typing import List
+from typing import List, Union
+
+import numpy as np
 
 
 class Matrix:
     """A class to represent a mathematical matrix and perform basic operations."""
 
-    def __init__(self, data: List[List[float]]):
-        """Initialize the matrix with a 2D list."""
-        if not data or not all(len(row) == len(data[0]) for row in data):
-            raise ValueError("All rows must have the same number of columns.")
-        self.data = data
-        self.rows = len(data)
-        self.cols = len(data[0])
+    __slots__ = ("_data", "_rows", "_cols", "_repr", "_str")
+
+    def __init__(self, data: Union[List[List[float]], np.ndarray]):
+        """Initialize the matrix with a 2D list, stored as a float64 ndarray."""
+        if not isinstance(data, np.ndarray):
+            if not data:
+                raise ValueError("All rows must have the same number of columns.")
+            width = len(data[0])
+            if not all(len(row) == width for row in data):
+                raise ValueError("All rows must have the same number of columns.")
+        # A private read-only copy keeps the matrix immutable so its strings can
+        # be cached; C order lets BLAS use its row-major kernels without copying.
+        self._data = np.array(data, dtype=np.float64, order="C")
+        self._data.flags.writeable = False
+        if self._data.ndim != 2:
+            raise ValueError("Matrix data must be two-dimensional.")
+        if self._data.size == 0:
+            raise ValueError("Matrix must have at least one row and one column.")
+        self._rows, self._cols = self._data.shape
+        self._repr = None
+        self._str = None
+
+    @property
+    def data(self) -> np.ndarray:
+        """Get the read-only float64 array holding the matrix entries."""
+        return self._data
+
+    @property
+    def rows(self) -> int:
+        """Get the number of rows of the matrix."""
+        return self._rows
+
+    @property
+    def cols(self) -> int:
+        """Get the number of columns of the matrix."""
+        return self._cols
 
     def __add__(self, other: "Matrix"):
         """A method to add two matrices."""
@@ -20,11 +51,7 @@ class Matrix:
             raise TypeError(f"Cannot add Matrix with {type(other).__name__}")
         if self.rows != other.rows or self.cols != other.cols:
             raise ValueError("Matrices must have the same dimensions to add.")
-        result = [
-            [self.data[i][j] + other.data[i][j] for j in range(self.cols)]
-            for i in range(self.rows)
-        ]
-        return Matrix(result)
+        return Matrix(self.data + other.data)
 
     def __sub__(self, other: "Matrix"):
         """A method to subtract two matrices."""
@@ -32,19 +59,33 @@ class Matrix:
             raise TypeError(f"Cannot subtract Matrix with {type(other).__name__}")
         if self.rows != other.rows or self.cols != other.cols:
             raise ValueError("Matrices must have the same dimensions to subtract.")
-        result = [
-            [self.data[i][j] - other.data[i][j] for j in range(self.cols)]
-            for i in range(self.rows)
-        ]
-        return Matrix(result)
+        return Matrix(self.data - other.data)
+
+    def __matmul__(self, other: "Matrix"):
+        """A method to multiply two matrices."""
+        if not isinstance(other, Matrix):
+            raise TypeError(f"Cannot multiply Matrix with {type(other).__name__}")
+        if self.cols != other.rows:
+            raise ValueError(
+                "Left matrix columns must match right matrix rows to multiply."
+            )
+        return Matrix(self.data @ other.data)
 
     def __repr__(self) -> str:
         """Return a string representation of the matrix."""
-        return "\n".join(["\t".join(map(str, row)) for row in self.data])
+        if self._repr is None:
+            self._repr = "\n".join(
+                ["\t".join(map(str, row)) for row in self.data.tolist()]
+            )
+        return self._repr
 
     def __str__(self) -> str:
         """Return a user-friendly string representation of the matrix."""
-        return "\n".join(["[" + " ,".join(map(str, row)) + "]" for row in self.data])
+        if self._str is None:
+            self._str = "\n".join(
+                ["[" + " ,".join(map(str, row)) + "]" for row in self.data.tolist()]
+            )
+        return self._str
 
 
 if __name__ == "__main__":
@@ -56,6 +97,7 @@ if __name__ == "__main__":
 
     print("A + B:\n", A + B)
     print("A - B:\n", A - B)
+    print("A @ B^T:\n", A @ Matrix([[7, 10], [8, 11], [9, 12]]))
 
     print("A repr:\n", repr(A))
     print("B repr:\n", repr(B))
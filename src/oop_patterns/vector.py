@@ -1,80 +1,304 @@
 """Class representing a N-dimensional vector with basic operations."""
 
-from typing import List, Tuple
+import math
+from typing import Iterable, List, Sequence, Tuple, Union
+
+import numpy as np
+
+from src.oop_patterns.matrix import Matrix
+
+# Below this dimension a Python loop over the component tuples beats the
+# fixed per-call overhead of dispatching the dot product to BLAS. Both paths
+# read the same float64 values, since the components tuple mirrors _arr.
+_BLAS_THRESHOLD = 8
+
+# np.array_equal has a fixed cost of a few microseconds, so below this
+# dimension comparing the component tuples is faster.
+_ARRAY_EQUAL_THRESHOLD = 256
 
 
 class Vector:
     """A class to represent a N-dimensional vector."""
 
-    def __init__(self, components: List[float]):
-        if not components:
+    __slots__ = (
+        "_components",
+        "_arr",
+        "_dim",
+        "_magnitude",
+        "_unit_vector",
+        "_repr",
+        "_str",
+    )
+
+    def __init__(self, components: Union[Iterable[float], np.ndarray]):
+        if not isinstance(components, (list, tuple, np.ndarray)):
+            components = list(components)
+        # Always copy so the vector never aliases a caller's array.
+        arr = np.array(components, dtype=np.float64)
+        if arr.ndim != 1:
+            raise ValueError("Vector components must be one-dimensional.")
+        if arr.size == 0:
             raise ValueError("Vector must have at least one component.")
-        self._components = tuple(components)
+        self._set_array(arr)
+
+    @classmethod
+    def _from_array(cls, arr: np.ndarray) -> "Vector":
+        """Wrap a freshly computed 1-D float64 array without copying it."""
+        vector = cls.__new__(cls)
+        vector._set_array(arr)
+        return vector
+
+    def _set_array(self, arr: np.ndarray) -> None:
+        self._arr = arr
+        self._dim = len(arr)
+        self._invalidate()
+
+    def _invalidate(self) -> None:
+        # The tuple is rebuilt lazily from _arr, so in-place ops allocate nothing.
+        self._components = None
         self._magnitude = None
         self._unit_vector = None
+        self._repr = None
+        self._str = None
 
     @property
     def components(self) -> Tuple[float, ...]:
         """Get the components of the vector as a tuple."""
+        if self._components is None:
+            self._components = tuple(self._arr.tolist())
         return self._components
 
     @property
     def magnitude(self) -> float:
         """Compute and return the magnitude of the vector."""
         if self._magnitude is None:
-            self._magnitude = sum(a**2 for a in self._components) ** 0.5
+            # hypot scales before squaring, so huge or tiny components neither
+            # overflow nor underflow (np.linalg.norm squares directly for 1-D).
+            self._magnitude = math.hypot(*self.components)
         return self._magnitude
 
     @property
     def unit_vector(self) -> "Vector":
         """Compute and return the unit vector."""
+        # Only the array is cached; a fresh Vector is returned each time so an
+        # in-place op on the result cannot alter this vector's cache.
         if self._unit_vector is None:
             mag = self.magnitude
             if mag == 0:
                 raise ValueError("Cannot compute unit vector of a zero vector.")
-            self._unit_vector = Vector([a / mag for a in self._components])
-        return self._unit_vector
+            self._unit_vector = self._arr / mag
+        return Vector._from_array(self._unit_vector.copy())
+
+    # The happy paths below skip isinstance() and rely on attribute access;
+    # a non-Vector operand surfaces as AttributeError when its attributes are
+    # read and is re-raised as TypeError. Only those reads sit inside the try.
+    # The _dim check stays because NumPy would otherwise broadcast.
 
     def __add__(self, other: "Vector") -> "Vector":
-        if not isinstance(other, Vector):
-            raise TypeError(f"Cannot add Vector with {type(other).__name__}")
-        if len(self._components) != len(other.components):
+        try:
+            other_dim, other_arr = other._dim, other._arr
+        except AttributeError:
+            raise TypeError(f"Cannot add Vector with {type(other).__name__}") from None
+        if self._dim != other_dim:
             raise ValueError("Vectors must be of the same dimension to add.")
-        return Vector([a + b for a, b in zip(self._components, other.components)])
+        return Vector._from_array(self._arr + other_arr)
 
     def __sub__(self, other: "Vector") -> "Vector":
-        if not isinstance(other, Vector):
-            raise TypeError(f"Cannot subtract Vector with {type(other).__name__}")
-        if len(self._components) != len(other.components):
+        try:
+            other_dim, other_arr = other._dim, other._arr
+        except AttributeError:
+            raise TypeError(
+                f"Cannot subtract Vector with {type(other).__name__}"
+            ) from None
+        if self._dim != other_dim:
             raise ValueError("Vectors must be of the same dimension to subtract.")
-        return Vector([a - b for a, b in zip(self._components, other.components)])
+        return Vector._from_array(self._arr - other_arr)
+
+    def __iadd__(self, other: "Vector") -> "Vector":
+        """Add another vector in place, reusing this vector's buffer.
+
+        Unlike ``+`` this mutates the vector (and every name bound to it), so it
+        must not be used on a vector held in a set or as a dict key.
+        """
+        try:
+            other_dim, other_arr = other._dim, other._arr
+        except AttributeError:
+            raise TypeError(f"Cannot add Vector with {type(other).__name__}") from None
+        if self._dim != other_dim:
+            raise ValueError("Vectors must be of the same dimension to add.")
+        self._arr += other_arr
+        self._invalidate()
+        return self
+
+    def __isub__(self, other: "Vector") -> "Vector":
+        """Subtract another vector in place, reusing this vector's buffer.
+
+        The same mutation caveats as ``+=`` apply.
+        """
+        try:
+            other_dim, other_arr = other._dim, other._arr
+        except AttributeError:
+            raise TypeError(
+                f"Cannot subtract Vector with {type(other).__name__}"
+            ) from None
+        if self._dim != other_dim:
+            raise ValueError("Vectors must be of the same dimension to subtract.")
+        self._arr -= other_arr
+        self._invalidate()
+        return self
 
     def dot(self, other: "Vector") -> float:
-        """Compute the dot product of this vector with another vector."""
-        if not isinstance(other, Vector):
-            raise TypeError(f"Cannot compute dot product with {type(other).__name__}")
-        if len(self._components) != len(other.components):
+        """Compute the dot product of this vector with another vector.
+
+        Tiny vectors are latency-bound, so they use a plain Python loop; larger
+        ones go to BLAS, which picks its SIMD width for the running CPU.
+        """
+        try:
+            other_dim, other_arr = other._dim, other._arr
+        except AttributeError:
+            raise TypeError(
+                f"Cannot compute dot product with {type(other).__name__}"
+            ) from None
+        if self._dim != other_dim:
             raise ValueError(
                 "Vectors must be of the same dimension to compute dot product."
             )
-        return sum(a * b for a, b in zip(self._components, other.components))
+        if self._dim < _BLAS_THRESHOLD:
+            return float(
+                sum(a * b for a, b in zip(self.components, other.components))
+            )
+        return float(self._arr @ other_arr)
+
+    @classmethod
+    def dot_many(
+        cls,
+        query: "Vector",
+        vectors: Union[Sequence["Vector"], "VectorBatch", np.ndarray],
+    ) -> np.ndarray:
+        """Compute the dot product of a query vector with many vectors at once.
+
+        The vectors are stacked into an (N, D) array (a VectorBatch or ndarray is
+        used as-is) so all N products are a single BLAS matrix-vector call.
+        """
+        if not isinstance(query, cls):
+            raise TypeError(f"Cannot compute dot product with {type(query).__name__}")
+        if isinstance(vectors, VectorBatch):
+            stack = vectors.arr
+        elif isinstance(vectors, np.ndarray):
+            stack = np.ascontiguousarray(vectors, dtype=np.float64)
+        else:
+            if not vectors:
+                raise ValueError("dot_many requires at least one vector.")
+            for v in vectors:
+                if not isinstance(v, cls):
+                    raise TypeError(
+                        f"Cannot compute dot product with {type(v).__name__}"
+                    )
+            if len({len(v) for v in vectors}) != 1:
+                raise ValueError("Vectors must all have the same dimension.")
+            stack = np.stack([v._arr for v in vectors])
+        if stack.ndim != 2 or stack.shape[1] != query._dim:
+            raise ValueError(
+                "Vectors must be of the same dimension to compute dot product."
+            )
+        return stack @ query._arr
 
     def __repr__(self) -> str:
-        return f"Vector({self._components})"
+        if self._repr is None:
+            self._repr = f"Vector({self.components})"
+        return self._repr
 
     def __str__(self) -> str:
-        return f"({', '.join(map(str, self._components))})"
+        if self._str is None:
+            self._str = f"({', '.join(map(str, self.components))})"
+        return self._str
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Vector):
             return NotImplemented
-        return self._components == other.components
+        if self._dim != other._dim:
+            return False
+        if self._dim < _ARRAY_EQUAL_THRESHOLD:
+            return self.components == other.components
+        return np.array_equal(self._arr, other._arr)
 
     def __hash__(self) -> int:
-        return hash(self._components)
+        return hash(self.components)
+
+    def __len__(self) -> int:
+        return self._dim
+
+
+class VectorBatch:
+    """A class to represent N vectors of equal dimension as one (N, D) array."""
+
+    __slots__ = ("arr",)
+
+    def __init__(self, arr: Union[List[List[float]], np.ndarray]):
+        """Initialize the batch with a 2D list or array, one vector per row."""
+        self.arr = np.array(arr, dtype=np.float64, order="C")
+        if self.arr.ndim != 2 or self.arr.shape[0] == 0 or self.arr.shape[1] == 0:
+            raise ValueError("VectorBatch must be a non-empty (N, D) array.")
+
+    @classmethod
+    def from_vectors(cls, vectors: Sequence[Vector]) -> "VectorBatch":
+        """Build a batch by stacking the given vectors as rows."""
+        if not vectors:
+            raise ValueError("VectorBatch must contain at least one vector.")
+        for v in vectors:
+            if not isinstance(v, Vector):
+                raise TypeError(f"Cannot build VectorBatch from {type(v).__name__}")
+        if len({len(v) for v in vectors}) != 1:
+            raise ValueError("Vectors in a batch must all have the same dimension.")
+        return cls(np.stack([v._arr for v in vectors]))
+
+    def to_vectors(self) -> List[Vector]:
+        """Return the rows of the batch as individual Vector instances."""
+        return [Vector(row) for row in self.arr]
+
+    def _check(self, other: "VectorBatch", action: str) -> None:
+        if not isinstance(other, VectorBatch):
+            raise TypeError(f"Cannot {action} VectorBatch with {type(other).__name__}")
+        if self.arr.shape != other.arr.shape:
+            raise ValueError(f"Batches must have the same shape to {action}.")
+
+    def add_all(self, other: "VectorBatch") -> "VectorBatch":
+        """Add two batches row by row."""
+        self._check(other, "add")
+        return VectorBatch(self.arr + other.arr)
+
+    def sub_all(self, other: "VectorBatch") -> "VectorBatch":
+        """Subtract two batches row by row."""
+        self._check(other, "subtract")
+        return VectorBatch(self.arr - other.arr)
+
+    def dot_all(self, other: "VectorBatch") -> np.ndarray:
+        """Compute the row-wise dot products of two batches."""
+        self._check(other, "compute dot product of")
+        return np.einsum("ij,ij->i", self.arr, other.arr, optimize=True)
+
+    @property
+    def magnitudes(self) -> np.ndarray:
+        """Compute and return the magnitude of every vector in the batch."""
+        # Scale each row by its largest component so squaring cannot overflow,
+        # matching Vector.magnitude; all-zero rows keep a scale of 1.
+        scale = np.abs(self.arr).max(axis=1)
+        safe = np.where(scale == 0, 1.0, scale)
+        return safe * np.linalg.norm(self.arr / safe[:, None], axis=1)
+
+    def transform(self, matrix: Matrix) -> "VectorBatch":
+        """Multiply every vector in the batch by a matrix in a single GEMM call."""
+        if not isinstance(matrix, Matrix):
+            raise TypeError(
+                f"Cannot transform VectorBatch with {type(matrix).__name__}"
+            )
+        if matrix.cols != self.arr.shape[1]:
+            raise ValueError("Matrix columns must match the vector dimension.")
+        # (A @ X.T).T == X @ A.T, which keeps the result C-contiguous.
+        return VectorBatch(self.arr @ matrix.data.T)
 
     def __len__(self) -> int:
-        return len(self._components)
+        return self.arr.shape[0]
 
 
 # Example usage:
@@ -4,6 +4,8 @@
 class Organization:
     """Class representing an organization in the task management system."""
 
+    __slots__ = ("name", "address", "contact_email")
+
     def __init__(self, name: str, address: str, contact_email: str):
         """Initialize an Organization instance.
 
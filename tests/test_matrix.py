@@ -0,0 +1,60 @@
+"""Unit tests for the Matrix class in oop_patterns.matrix module."""
+
+import numpy as np
+import pytest
+
+from src.oop_patterns.matrix import Matrix
+
+
+def test_matrix_addition_and_subtraction():
+    """Test the addition and subtraction of two matrices."""
+    a = Matrix([[1, 2, 3], [4, 5, 6]])
+    b = Matrix([[7, 8, 9], [10, 11, 12]])
+    assert (a + b).data.tolist() == [[8, 10, 12], [14, 16, 18]]
+    assert (a - b).data.tolist() == [[-6, -6, -6], [-6, -6, -6]]
+
+
+def test_matrix_multiplication():
+    """Test the matrix product of two matrices."""
+    a = Matrix([[1, 2, 3], [4, 5, 6]])
+    b = Matrix([[7, 8], [9, 10], [11, 12]])
+    result = a @ b
+    assert (result.rows, result.cols) == (2, 2)
+    assert result.data.tolist() == [[58, 64], [139, 154]]
+
+
+def test_matrix_multiplication_dimension_mismatch():
+    """Test that multiplying incompatible matrices raises ValueError."""
+    a = Matrix([[1, 2, 3], [4, 5, 6]])
+    with pytest.raises(ValueError):
+        _ = a @ a
+
+
+def test_ragged_rows_raise_value_error():
+    """Test that rows of different lengths are rejected."""
+    with pytest.raises(ValueError):
+        Matrix([[1, 2], [3]])
+
+
+def test_empty_matrix_raises_value_error():
+    """Test that empty input is rejected for both lists and arrays."""
+    with pytest.raises(ValueError):
+        Matrix([])
+    with pytest.raises(ValueError):
+        Matrix([[]])
+    with pytest.raises(ValueError):
+        Matrix(np.zeros((0, 3)))
+
+
+def test_matrix_is_isolated_from_source_array():
+    """Test that the matrix copies its input and cannot be written through."""
+    source = np.array([[1.0, 2.0], [3.0, 4.0]])
+    m = Matrix(source)
+    assert str(m) == "[1.0 ,2.0]\n[3.0 ,4.0]"
+    source[0, 0] = 9
+    assert m.data[0, 0] == 1.0
+    assert str(m) == "[1.0 ,2.0]\n[3.0 ,4.0]"
+    with pytest.raises(ValueError):
+        m.data[0, 0] = 9
+    with pytest.raises(AttributeError):
+        m.data = np.zeros((3, 3))  # type: ignore[misc]
@@ -0,0 +1,25 @@
+"""Unit tests for the Organization class in task_management_system.models.tenant."""
+
+from src.task_management_system.models.tenant.organization import Organization
+
+
+def test_organization_repr_and_str():
+    """Test the string representations of an organization."""
+    org = Organization("Acme", "1 Main St", "hi@acme.com")
+    assert repr(org) == (
+        "Organization(name=Acme, address=1 Main St, contact_email=hi@acme.com)"
+    )
+    assert str(org) == "Acme located at 1 Main St. Contact: hi@acme.com"
+
+
+def test_organization_fields_are_writable():
+    """Test that updating a field is reflected in the cached representations."""
+    org = Organization("Acme", "1 Main St", "hi@acme.com")
+    repr(org), str(org)
+    org.name = "Globex"
+    org.contact_email = "hi@globex.com"
+    assert org.name == "Globex"
+    assert repr(org) == (
+        "Organization(name=Globex, address=1 Main St, contact_email=hi@globex.com)"
+    )
+    assert str(org) == "Globex located at 1 Main St. Contact: hi@globex.com"
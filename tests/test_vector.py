@@ -1,8 +1,10 @@
 """Unit tests for the Vector class in oop_patterns.vector module."""
 
+import numpy as np
 import pytest
 
-from src.oop_patterns.vector import Vector
+from src.oop_patterns.matrix import Matrix
+from src.oop_patterns.vector import Vector, VectorBatch
 
 
 def test_components_are_tuples():
@@ -12,6 +14,38 @@ def test_components_are_tuples():
     assert v.components == (1, 2, 3)
 
 
+def test_components_normalized_to_floats():
+    """Test that list-built and derived vectors expose the same float components."""
+    v = Vector([1, 2])
+    assert repr(v) == "Vector((1.0, 2.0))"
+    assert repr(v + Vector([3, 4])) == "Vector((4.0, 6.0))"
+
+
+def test_vector_does_not_alias_source_array():
+    """Test that writing to the source array does not change the vector."""
+    arr = np.array([1.0, 2.0])
+    v = Vector(arr)
+    arr[0] = 100
+    assert v == Vector([1, 2])
+    assert v.dot(Vector([1, 0])) == 1.0
+
+
+def test_vector_from_iterable():
+    """Test that any iterable of numbers can build a vector."""
+    assert Vector(x for x in [1, 2]).components == (1, 2)
+    assert Vector(range(3)).components == (0, 1, 2)
+
+
+def test_invalid_shapes_raise_value_error():
+    """Test that empty or multi-dimensional input is rejected."""
+    with pytest.raises(ValueError):
+        Vector([])
+    with pytest.raises(ValueError):
+        Vector(x for x in [])
+    with pytest.raises(ValueError):
+        Vector([[1, 2], [3, 4]])
+
+
 def test_components_immutable():
     """Test that the components of the vector are immutable."""
     v = Vector([1, 2, 3])
@@ -26,6 +60,13 @@ def test_magnitude():
     assert v.magnitude == 5.0
 
 
+def test_magnitude_does_not_overflow():
+    """Test that huge components give a finite magnitude and unit vector."""
+    v = Vector([1e200, 1e200])
+    assert v.magnitude == pytest.approx(2**0.5 * 1e200)
+    assert v.unit_vector.components == pytest.approx((2**-0.5, 2**-0.5))
+
+
 def test_unit_vector():
     """Test the unit_vector property of the vector."""
     v = Vector([3, 4])
@@ -59,6 +100,21 @@ def test_dot_product():
     assert result == 32  # 1*4 + 2*5 + 3*6
 
 
+def test_dot_product_high_dimension():
+    """Test the dot product of vectors large enough to use BLAS."""
+    v1 = Vector(list(range(100)))
+    v2 = Vector([2] * 100)
+    assert v1.dot(v2) == 2 * sum(range(100))
+
+
+@pytest.mark.parametrize("dim", [7, 8, 9])
+def test_dot_product_matches_across_blas_threshold(dim):
+    """Test that the loop and BLAS paths of dot agree on float64 inputs."""
+    v1 = Vector([2**53 + 1] * dim)
+    v2 = Vector([1] * dim)
+    assert v1.dot(v2) == float(dim * 2**53)
+
+
 def test_vector_length():
     """Test the length of the vector using len()."""
     v = Vector([1, 2, 3, 4])
@@ -77,9 +133,156 @@ def test_vector_equality_and_hashing():
     assert hash(v1) != hash(v3)
 
 
+def test_equal_vectors_hash_equal():
+    """Test that vectors equal as float64 arrays also hash equal."""
+    v1 = Vector([2**53])
+    v2 = Vector([2**53 + 1])  # rounds to the same float64
+    assert v1 == v2
+    assert hash(v1) == hash(v2)
+    assert Vector([1, 2]) != Vector([1, 2, 3])
+    assert Vector([1, 2]) != (1, 2)
+
+
+@pytest.mark.parametrize("dim", [3, 255, 256, 1000])
+def test_equality_across_array_equal_threshold(dim):
+    """Test that tuple and array comparison paths of __eq__ agree."""
+    v1 = Vector(list(range(dim)))
+    assert v1 == Vector(list(range(dim)))
+    assert v1 != Vector(list(range(dim - 1)) + [-1])
+
+
+def test_in_place_addition_and_subtraction():
+    """Test that += and -= update the vector and its cached properties."""
+    v = Vector([3, 4])
+    original = v
+    assert v.magnitude == 5.0
+    v += Vector([3, 4])
+    assert v is original
+    assert v.components == (6, 8)
+    assert v.magnitude == 10.0
+    v -= Vector([6, 8])
+    assert v == Vector([0, 0])
+    assert repr(v) == "Vector((0.0, 0.0))"
+
+
+def test_in_place_addition_mutates_shared_references():
+    """Test that += updates every name bound to the vector, unlike +."""
+    a = Vector([1, 2])
+    b = a
+    a += Vector([1, 1])
+    assert b is a
+    assert b.components == (2.0, 3.0)
+
+    c = Vector([1, 2])
+    d = c
+    c = c + Vector([1, 1])
+    assert d.components == (1.0, 2.0)
+
+
+def test_in_place_addition_on_unit_vector_keeps_cache():
+    """Test that += on a returned unit vector leaves the source's cache intact."""
+    v = Vector([3, 4])
+    u = v.unit_vector
+    u += Vector([1, 1])
+    assert v.unit_vector == Vector([0.6, 0.8])
+    assert pytest.approx(v.unit_vector.magnitude) == 1.0
+
+
+def test_in_place_addition_does_not_modify_source_arrays():
+    """Test that += never writes through to a batch or array the vector came from."""
+    batch = VectorBatch([[1, 2], [3, 4]])
+    v = batch.to_vectors()[0]
+    v += Vector([10, 10])
+    assert v.components == (11, 12)
+    assert batch.to_vectors()[0] == Vector([1, 2])
+
+    arr = np.array([1.0, 2.0])
+    w = Vector(arr)
+    w += Vector([1, 1])
+    assert arr.tolist() == [1.0, 2.0]
+
+
 def test_dimension_mismatch_addition():
     """Test that adding vectors of different dimensions raises ValueError."""
     v1 = Vector([1, 2])
     v2 = Vector([1, 2, 3])
     with pytest.raises(ValueError):
         _ = v1 + v2
+
+
+def test_non_vector_operand_raises_type_error():
+    """Test that operating on a non-Vector raises TypeError."""
+    v = Vector([1, 2, 3])
+    with pytest.raises(TypeError):
+        _ = v + 1
+    with pytest.raises(TypeError):
+        _ = v - [1, 2, 3]
+    with pytest.raises(TypeError):
+        v.dot((1, 2, 3))  # type: ignore[arg-type]
+
+
+def test_vector_batch_operations():
+    """Test the bulk operations of VectorBatch against per-Vector results."""
+    vectors = [Vector([1, 2, 3]), Vector([4, 5, 6])]
+    others = [Vector([7, 8, 9]), Vector([1, 0, 1])]
+    batch = VectorBatch.from_vectors(vectors)
+    other_batch = VectorBatch.from_vectors(others)
+
+    assert len(batch) == 2
+    assert batch.add_all(other_batch).to_vectors() == [
+        a + b for a, b in zip(vectors, others)
+    ]
+    assert batch.sub_all(other_batch).to_vectors() == [
+        a - b for a, b in zip(vectors, others)
+    ]
+    assert list(batch.dot_all(other_batch)) == [
+        a.dot(b) for a, b in zip(vectors, others)
+    ]
+    assert list(batch.magnitudes) == pytest.approx([v.magnitude for v in vectors])
+
+
+def test_vector_batch_magnitudes_do_not_overflow():
+    """Test that batch magnitudes match Vector.magnitude for extreme values."""
+    vectors = [Vector([1e200, 1e200]), Vector([0, 0]), Vector([3, 4])]
+    batch = VectorBatch.from_vectors(vectors)
+    assert list(batch.magnitudes) == pytest.approx([v.magnitude for v in vectors])
+
+
+def test_vector_batch_transform():
+    """Test multiplying every vector in a batch by a matrix."""
+    batch = VectorBatch([[1, 2], [3, 4]])
+    swap = Matrix([[0, 1], [1, 0]])
+    assert batch.transform(swap).to_vectors() == [Vector([2, 1]), Vector([4, 3])]
+    with pytest.raises(ValueError):
+        batch.transform(Matrix([[1, 2, 3]]))
+    with pytest.raises(TypeError):
+        batch.transform([[0, 1], [1, 0]])  # type: ignore[arg-type]
+    with pytest.raises(TypeError):
+        VectorBatch.from_vectors([[1, 2], [3, 4]])  # type: ignore[list-item]
+
+
+def test_vector_batch_does_not_alias():
+    """Test that batches and their vectors do not share memory with their sources."""
+    source = np.array([[1.0, 2.0], [3.0, 4.0]])
+    batch = VectorBatch(source)
+    vectors = batch.to_vectors()
+    source[0, 0] = 99
+    batch.arr[0, 1] = 50
+    assert batch.arr[0, 0] == 1.0
+    assert vectors[0] == Vector([1, 2])
+    assert vectors[0].dot(Vector([0, 1])) == 2.0
+
+
+def test_dot_many():
+    """Test dotting one query vector against many vectors at once."""
+    query = Vector([1, 2, 3])
+    vectors = [Vector([4, 5, 6]), Vector([1, 0, 0]), Vector([0, 0, 2])]
+    expected = [query.dot(v) for v in vectors]
+
+    assert list(Vector.dot_many(query, vectors)) == expected
+    assert list(Vector.dot_many(query, VectorBatch.from_vectors(vectors))) == expected
+    assert list(Vector.dot_many(query, np.array([[4, 5, 6]]))) == [32]
+    with pytest.raises(ValueError):
+        Vector.dot_many(query, [Vector([1, 2])])
+    with pytest.raises(TypeError):
+        Vector.dot_many(query, [[1, 2, 3]])  # type: ignore[list-item]